@@ -15,7 +15,10 @@ http://localhost:5000/ and the API at http://localhost:5000/api/v1/docs
 
 """
 
+import asyncio
+import json
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Union
 
@@ -51,8 +54,9 @@ DEFAULT_N = 10
 BASE_DIR = Path(g2p.__file__).parent
 
 TEMPLATES = Jinja2Templates(directory=BASE_DIR / "templates")
+DEBUG = bool(os.getenv("G2P_STUDIO_DEBUG"))
 server_args: Dict[str, Union[bool, str]] = {"async_mode": "asgi"}
-if os.getenv("G2P_STUDIO_DEBUG"):
+if DEBUG:
     server_args["logger"] = server_args["engineio_logger"] = True
 SIO = socketio.AsyncServer(**server_args)
 SIO_APP = socketio.ASGIApp(socketio_server=SIO, socketio_path="/ws/socket.io")
@@ -74,7 +78,7 @@ async def redirect_to_openapi(request: Request) -> RedirectResponse:
 
 
 APP = Starlette(
-    debug=True,
+    debug=DEBUG,
     routes=[
         Route("/", home),
         Mount("/ws", SIO_APP),
@@ -175,32 +179,75 @@ def return_echart_data(tg: Union[CompositeTransductionGraph, TransductionGraph])
     return nodes, edges
 
 
+# Most recently used transducers built from g2p-studio mappings, keyed by
+# their serialized payload, so that the same tables are not recompiled on
+# every keystroke. Only compiling the mappings is saved this way: wrapping
+# them in a CompositeTransducer for each event is cheap.
+_TRANSDUCER_CACHE: "OrderedDict[str, Transducer]" = OrderedDict()
+TRANSDUCER_CACHE_SIZE = 32
+
+
+def mapping_to_transducer(mapping: dict) -> Transducer:
+    """Return a Transducer for a mapping sent by g2p-studio, reusing a
+    previously built one if the same mapping was seen recently."""
+    key = json.dumps(mapping, sort_keys=True, ensure_ascii=False)
+    if key in _TRANSDUCER_CACHE:
+        _TRANSDUCER_CACHE.move_to_end(key)
+        return _TRANSDUCER_CACHE[key]
+    mapping_args = {**mapping["kwargs"]}
+    mapping_args["abbreviations"] = flatten_abbreviations_format(
+        mapping["abbreviations"]
+    )
+    if mapping_args["type"] == "lexicon":
+        lexicon = Mapping.find_mapping(
+            mapping_args["in_lang"], mapping_args["out_lang"]
+        )
+        mapping_args["alignments"] = lexicon.alignments
+    else:
+        mapping_args["rules"] = mapping["rules"]
+    transducer = Transducer(Mapping(**mapping_args))
+    _TRANSDUCER_CACHE[key] = transducer
+    if len(_TRANSDUCER_CACHE) > TRANSDUCER_CACHE_SIZE:
+        _TRANSDUCER_CACHE.popitem(last=False)
+    return transducer
+
+
+# The latest conversion event from each client that is still waiting to be
+# converted. Events arriving while one is waiting replace it, so a burst of
+# keystrokes is only converted once, for the latest input.
+_PENDING_CONVERSIONS: Dict[str, dict] = {}
+# How long, in seconds, a conversion event waits for newer ones
+CONVERSION_DELAY = 0.05
+
+
 @SIO.on("conversion event", namespace="/convert")  # type: ignore
 async def convert(sid, message):
-    """Convert input text and return output"""
+    """Convert input text and return output, once typing pauses"""
+    waiting = sid in _PENDING_CONVERSIONS
+    _PENDING_CONVERSIONS[sid] = message
+    if waiting:
+        LOGGER.debug("/convert: superseding the waiting event for %s", sid)
+        return
+    await asyncio.sleep(CONVERSION_DELAY)
+    message = _PENDING_CONVERSIONS.pop(sid, None)
+    if message is None:
+        # The client disconnected in the meantime
+        return
+    await convert_message(sid, message)
+
+
+async def convert_message(sid, message):
+    """Convert the input text of a conversion event and send the output"""
     transducers = []
     LOGGER.debug("/convert: %s", message)
     for mapping in message["data"]["mappings"]:
-        mapping_args = {**mapping["kwargs"]}
-        mapping_args["abbreviations"] = flatten_abbreviations_format(
-            mapping["abbreviations"]
-        )
-        if mapping_args["type"] == "lexicon":
-            lexicon = Mapping.find_mapping(
-                mapping_args["in_lang"], mapping_args["out_lang"]
-            )
-            mapping_args["alignments"] = lexicon.alignments
-        else:
-            mapping_args["rules"] = mapping["rules"]
         try:
-            mappings_obj = Mapping(**mapping_args)
-            transducer = Transducer(mappings_obj)
-            transducers.append(transducer)
+            transducers.append(mapping_to_transducer(mapping))
         except Exception as e:
             LOGGER.warning(
                 "Skipping invalid mapping %s->%s:\n%s",
-                mapping_args["in_lang"],
-                mapping_args["out_lang"],
+                mapping["kwargs"]["in_lang"],
+                mapping["kwargs"]["out_lang"],
                 e,
             )
     if len(transducers) == 0:
@@ -236,6 +283,57 @@ async def convert(sid, message):
         )
 
 
+def custom_table() -> List[dict]:
+    """Return an empty table for g2p-studio to define a custom mapping"""
+    # These are only used to generate JSON to send to the client,
+    # so it's safe to create a list of references to the same thing.
+    mapping_dicts = [
+        {"in": "", "out": "", "context_before": "", "context_after": ""}
+    ] * DEFAULT_N
+    abbs = [[""] * 6] * DEFAULT_N
+
+    kwargs = _MappingModelDefinition(
+        language_name="Custom",
+        display_name="Custom",
+        in_lang="custom",
+        out_lang="custom",
+        type="mapping",
+        norm_form="NFC",
+        # Put something here to silence a warning
+        rules=[Rule(rule_input="a", rule_output="a")],
+    ).model_dump()
+    kwargs["rules"] = []
+    # Remove the bogus rule we used to silence the validator
+    kwargs["include"] = False
+    return [
+        {
+            "mappings": mapping_dicts,
+            "abbs": abbs,
+            "kwargs": kwargs,
+        }
+    ]
+
+
+def lookup_tables(in_lang: str, out_lang: str) -> List[dict]:
+    """Return the tables for each mapping on the path from in_lang to out_lang,
+    serialized for g2p-studio."""
+    if in_lang == "custom" or out_lang == "custom":
+        return custom_table()
+    path = LANGS_NETWORK.shortest_path(in_lang, out_lang)
+    mappings: List[Mapping] = []
+    for lang1, lang2 in zip(path[:-1], path[1:]):
+        transducer = make_g2p(lang1, lang2, tokenize=False)
+        mappings.append(transducer.mapping)
+    return [
+        {
+            "mappings": x.plain_mapping(),
+            "abbs": expand_abbreviations_format(x.abbreviations),
+            "kwargs": x.model_dump(exclude={"alignments"}),
+        }
+        for x in mappings
+    ]
+
+
 @SIO.on("table event", namespace="/table")  # type: ignore
 async def change_table(sid, message) -> None:
     """Change the lookup table"""
@@ -247,60 +345,21 @@ async def change_table(sid, message) -> None:
             sid,
             namespace="/table",
         )
-    elif message["in_lang"] == "custom" or message["out_lang"] == "custom":
-        # These are only used to generate JSON to send to the client,
-        # so it's safe to create a list of references to the same thing.
-        mapping_dicts = [
-            {"in": "", "out": "", "context_before": "", "context_after": ""}
-        ] * DEFAULT_N
-        abbs = [[""] * 6] * DEFAULT_N
-
-        kwargs = _MappingModelDefinition(
-            language_name="Custom",
-            display_name="Custom",
-            in_lang="custom",
-            out_lang="custom",
-            type="mapping",
-            norm_form="NFC",
-            # Put something here to silence a warning
-            rules=[Rule(rule_input="a", rule_output="a")],
-        ).model_dump()
-        kwargs["rules"] = []
-        # Remove the bogus rule we used to silence the validator
-        kwargs["include"] = False
-        await SIO.emit(
-            "table response",
-            [
-                {
-                    "mappings": mapping_dicts,
-                    "abbs": abbs,
-                    "kwargs": kwargs,
-                }
-            ],
-            sid,
-            namespace="/table",
-        )
     else:
-        path = LANGS_NETWORK.shortest_path(message["in_lang"], message["out_lang"])
-        mappings: List[Mapping] = []
-        for lang1, lang2 in zip(path[:-1], path[1:]):
-            transducer = make_g2p(lang1, lang2, tokenize=False)
-            mappings.append(transducer.mapping)
         await SIO.emit(
             "table response",
-            [
-                {
-                    "mappings": x.plain_mapping(),
-                    "abbs": expand_abbreviations_format(x.abbreviations),
-                    "kwargs": x.model_dump(exclude={"alignments"}),
-                }
-                for x in mappings
-            ],
+            lookup_tables(message["in_lang"], message["out_lang"]),
             sid,
             namespace="/table",
         )
 
 
+@SIO.on("disconnect", namespace="/convert")  # type: ignore
+async def convert_disconnect(sid):
+    """Forget about conversion events from a client that has left"""
+    _PENDING_CONVERSIONS.pop(sid, None)
+
+
 @SIO.on("connect", namespace="/connect")  # type: ignore
 async def test_connect(sid, message):
     """Let client know disconnected"""
@@ -2,6 +2,7 @@
 Command line interface to the g2p system
 """
 
+import codecs
 import io
 import json
 import os
@@ -27,11 +28,23 @@ from g2p.static import __file__ as static_file
 
 PRINTER = pprint.PrettyPrinter(indent=4)
 
-if "pytest" not in sys.modules:  # pragma: no cover
-    if sys.stdout.encoding != "utf8" and hasattr(sys.stdout, "buffer"):
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf8")
-    if sys.stderr.encoding != "utf8" and hasattr(sys.stderr, "buffer"):
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf8")
+
+def _ensure_utf8_stdio():
+    """Make sure the CLI can print any Unicode regardless of the locale.
+
+    This is done when a command runs, not at import time, so that merely
+    importing g2p.cli does not replace sys.stdout and sys.stderr for the
+    importing program.
+    """
+    for name in ("stdout", "stderr"):
+        stream = getattr(sys, name)
+        encoding = getattr(stream, "encoding", None)
+        if encoding is None or codecs.lookup(encoding).name == "utf-8":
+            continue
+        if hasattr(stream, "reconfigure"):
+            stream.reconfigure(encoding="utf8")
+        elif hasattr(stream, "buffer"):  # pragma: no cover
+            setattr(sys, name, io.TextIOWrapper(stream.buffer, encoding="utf8"))
 
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
@@ -109,6 +122,7 @@ def parse_from_or_to_lang_spec(lang_spec):
 @click.group(context_settings=CONTEXT_SETTINGS)
 def cli():
     """Management script for G2P"""
+    _ensure_utf8_stdio()
 
 
 @click.option(
@@ -9,7 +9,7 @@ import json
 import os
 import re
 from copy import deepcopy
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Callable, Dict, List, Pattern, Union
 
@@ -42,6 +42,18 @@ from g2p.mappings.utils import (
 GEN_DIR = os.path.join(os.path.dirname(LANGS_FILE), "generated")
 
 
+@lru_cache(maxsize=8192)
+def compile_rule_pattern(pattern: str, case_sensitive: bool) -> Pattern:
+    """Compile the regex for a rule, sharing compiled patterns between rules
+
+    The built-in mappings have thousands of rules but far fewer distinct
+    patterns, more than re's own cache holds.
+    """
+    if case_sensitive:
+        return re.compile(pattern)
+    return re.compile(pattern, re.I)
+
+
 class Mapping(_MappingModelDefinition):
     """Class for lookup tables"""
 
@@ -272,10 +284,7 @@ class Mapping(_MappingModelDefinition):
             inp = create_fixed_width_lookbehind(rule.context_before) + input_match
             if rule.context_after:
                 inp += f"(?={rule.context_after})"
-            if not self.case_sensitive:
-                rule_regex = re.compile(inp, re.I)
-            else:
-                rule_regex = re.compile(inp)
+            rule_regex = compile_rule_pattern(inp, self.case_sensitive)
         except re.error as e:
             in_lang = self.in_lang
             out_lang = self.out_lang
@@ -7,10 +7,13 @@ Utilities used by other classes
 import csv
 import json
 import os
+import re as stdlib_re
 import unicodedata as ud
 from bisect import bisect_left
 from collections import defaultdict
 from enum import Enum
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
 from typing import (
     Any,
@@ -117,30 +120,24 @@ def expand_abbreviations(data: str, abbs: Dict[str, List[str]], recursion_depth=
     return data
 
 
-def flatten_abbreviations_format(data):
-    """Turn a CSV-sourced list of lists into a flattened DefaultDict"""
-    default_dict = defaultdict(list)
+def flatten_abbreviations_format(data) -> Dict[str, List[str]]:
+    """Turn a CSV-sourced list of lists into a flattened dict
+
+    Blank rows are skipped, and rows repeating an abbreviation extend its
+    definitions rather than replacing them.
+    """
+    abbs: Dict[str, List[str]] = {}
     for line in data:
-        if line[0]:
-            default_dict[line[0]].extend(
-                [definition for definition in line[1:] if definition]
-            )
-    return default_dict
+        if line and line[0]:
+            abbs.setdefault(line[0], []).extend(filter(None, line[1:]))
+    return abbs
 
 
 def expand_abbreviations_format(data):
-    """Expand a flattened DefaultDict into a CSV-formatted list of lists"""
-    lines = []
-    if data:
-        for key in data.keys():
-            line = [key]
-            for col in data[key]:
-                line.append(col)
-            lines.append(line)
-    if not lines:
-        while len(lines) < 10:
-            lines.append(["", "", "", "", "", ""])
-    return lines
+    """Expand a flattened dict into a CSV-formatted list of lists"""
+    if not data:
+        return [[""] * 6 for _ in range(10)]
+    return [[key, *cols] for key, cols in data.items()]
 
 
 def normalize(inp: str, norm_form: Union[str, None]):
@@ -242,15 +239,29 @@ def normalize_with_indices(
     raise exceptions.InvalidNormalization(norm_form)
 
 
+# This pattern needs none of the regex module's extensions, and the stdlib re
+# module is cheaper to call for it
+_UNICODE_ESCAPE_PATTERN = stdlib_re.compile(r"""\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{6})""")
+
+
 def unicode_escape(text):
     """Find any escaped characters and turn them into codepoints"""
-    return re.sub(r"""\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{6})""", escape_to_codepoint, text)
+    # Most strings contain no escapes at all, so skip the regex for them.
+    # The unicode_escape codec is not used because it would also decode
+    # sequences like \b or \t that are meaningful in rule regexes.
+    if "\\" not in text:
+        return text
+    return _UNICODE_ESCAPE_PATTERN.sub(escape_to_codepoint, text)
+
+
+@lru_cache(maxsize=1024)
+def _hex_to_char(hex_codepoint: str) -> str:
+    return chr(int(hex_codepoint, base=16))
 
 
 def escape_to_codepoint(match):
     """Turn escape into codepoint"""
-    hex_codepoint = match.group(1)[1:]
-    return chr(int(hex_codepoint, base=16))
+    return _hex_to_char(match.group(1)[1:])
 
 
 EXPLICIT_INDEX_PATTERN = re.compile(r"{\d+}")
@@ -271,53 +282,136 @@ def strip_index_notation(string: str) -> str:
     Returns:
         str: a string without explicit indices
     """
-    return re.sub(EXPLICIT_INDEX_PATTERN, "", string)
+    if "{" not in string:
+        return string
+    return EXPLICIT_INDEX_PATTERN.sub("", string)
+
+
+# re.I treats the dotted İ and the dotless ı as variants of i, str.casefold doesn't
+_DOTTED_AND_DOTLESS_I = str.maketrans("İı", "ii")
+
+
+def case_fold(string: str) -> str:
+    """Case fold a string, such that any literal found in it by a
+    case-insensitive regex is also found in it once both are case folded
+
+    >>> case_fold("Iİıi")
+    'iiii'
+    """
+    return string.translate(_DOTTED_AND_DOTLESS_I).casefold()
+
+
+# Rule inputs made only of plain or backslash-escaped characters (which is
+# what escape_special produces) match exactly one literal string
+_LITERAL_INPUT_PATTERN = stdlib_re.compile(
+    r"""(?:[^\\.^$*+?{}\[\]|()]|\\[^0-9A-Za-z])*""", stdlib_re.S
+)
+_LITERAL_ESCAPE_PATTERN = stdlib_re.compile(r"\\(.)", stdlib_re.S)
+
+
+def literal_rule_input(rule_input: str) -> Optional[str]:
+    r"""Return the literal string matched by a rule input, or None if the
+    input uses any regular expression syntax
+
+    >>> literal_rule_input('t{0}s{1}')
+    'ts'
+
+    >>> literal_rule_input('a\\.b')
+    'a.b'
+
+    >>> literal_rule_input('a|b') is None
+    True
+
+    >>> literal_rule_input('\\bk') is None
+    True
+
+    Args:
+        rule_input (str): the input of a rule, possibly with explicit indices
+
+    Returns:
+        Optional[str]: the literal string, or None if the input is not literal
+    """
+    rule_input = strip_index_notation(rule_input)
+    if not _LITERAL_INPUT_PATTERN.fullmatch(rule_input):
+        return None
+    return _LITERAL_ESCAPE_PATTERN.sub(r"\1", rule_input)
+
+
+_LOOKBEHIND_PATTERN = re.compile(
+    r"""
+        # lookbehind
+        (?<=\(?)
+        # match any number of Unicode characters and diacritics, plus
+        # square brackets, and backslash so patterns like \b can be used
+        [\\\[\]\p{L}\p{M}|.:'^$]+
+        # lookahead
+        (?=\)?)
+    """,
+    re.U | re.VERBOSE,
+)
 
 
 def create_fixed_width_lookbehind(pattern):
     """Turn all characters into fixed width lookbehinds"""
-    return re.sub(
-        re.compile(
-            r"""
-                # lookbehind
-                (?<=\(?)
-                # match any number of Unicode characters and diacritics, plus
-                # square brackets, and backslash so patterns like \b can be used
-                [\\\[\]\p{L}\p{M}|.:'^$]+
-                # lookahead
-                (?=\)?)
-            """,
-            re.U | re.VERBOSE,
-        ),
-        pattern_to_fixed_width_lookbehinds,
-        pattern,
-    )
+    return _LOOKBEHIND_PATTERN.sub(pattern_to_fixed_width_lookbehinds, pattern)
 
 
 def pattern_to_fixed_width_lookbehinds(match):
     """Python must have fixed-width lookbehinds."""
-    pattern = match.group()
-    pattern = sorted(pattern.split("|"), key=len, reverse=True)
     # in python ^ and $ have null length so must be ordered differently for proper
     # fixed-width lookbehinds
     null_length_characters = ["^", "$"]
-    current_len = 0 if pattern[0] in null_length_characters else len(pattern[0])
-    all_lookbehinds = []
-    current_list = []
-    for item in pattern:
-        item_length = 0 if item in null_length_characters else len(item)
-        if item_length == current_len:
-            current_list.append(item)
-        else:
-            current_len = item_length
-            all_lookbehinds.append(current_list)
-            current_list = [item]
-        if pattern.index(item) == len(pattern) - 1:
-            all_lookbehinds.append(current_list)
-    all_lookbehinds = [f"(?<={'|'.join(items)})" for items in all_lookbehinds]
+
+    def item_length(item):
+        return 0 if item in null_length_characters else len(item)
+
+    # sort and group by the same width so each width yields exactly one lookbehind
+    pattern = sorted(match.group().split("|"), key=item_length, reverse=True)
+    all_lookbehinds = [
+        f"(?<={optimize_alternation(list(items))})"
+        for _, items in groupby(pattern, key=item_length)
+    ]
     return "(" + "|".join(all_lookbehinds) + ")"
 
 
+_REGEX_SPECIAL_CHARACTERS = frozenset("\\[]^$.|?*+(){}-")
+
+
+def optimize_alternation(items: List[str]) -> str:
+    """Join alternatives of the same width into a compact regex.
+
+    Single characters are collapsed into a character class and a prefix
+    shared by all alternatives is factored out, which gives the regex
+    engine far fewer branches to try. Alternatives containing regex
+    special characters are joined as-is.
+
+    >>> optimize_alternation(["a", "b", "c"])
+    '[abc]'
+    >>> optimize_alternation(["ab", "ac", "ad"])
+    'a[bcd]'
+    >>> optimize_alternation(["abc", "abd", "aec"])
+    'a(?:bc|bd|ec)'
+    >>> optimize_alternation(["ab", "cd"])
+    'ab|cd'
+    >>> optimize_alternation(["a", "."])
+    'a|.'
+    """
+    if any(_REGEX_SPECIAL_CHARACTERS.intersection(item) for item in items):
+        return "|".join(items)
+    items = list(dict.fromkeys(items))
+    if len(items) == 1:
+        return items[0]
+    if all(len(item) == 1 for item in items):
+        return "[" + "".join(items) + "]"
+    prefix = os.path.commonprefix(items)
+    if prefix:
+        suffixes = optimize_alternation([item[len(prefix) :] for item in items])
+        if "|" in suffixes:
+            suffixes = f"(?:{suffixes})"
+        return prefix + suffixes
+    return "|".join(items)
+
+
 def load_from_workbook(language):
     """Parse mapping from Excel workbook"""
     from openpyxl import load_workbook  # Expensive import, do it only when needed
@@ -351,19 +445,15 @@ def load_from_workbook(language):
 
 def load_from_csv(language, delimiter=","):
     """Parse mapping from csv"""
-    work_sheet = []
     with open(language, encoding="utf8") as f:
-        reader = csv.reader(f, delimiter=delimiter)
-        for line in reader:
-            work_sheet.append(line)
+        work_sheet = list(csv.reader(f, delimiter=delimiter))
     # Create wordlist
     mapping = []
     # Loop through rows in worksheet, remove any stray BOMs
-    # (zero-width non-breaking spaces), create if statements for
-    # different columns and append mappings to self.mapping.
+    # (zero-width non-breaking spaces), unpack the in, out and optional
+    # context columns and append mappings to self.mapping.
     remove_bom = str.maketrans("", "", "\ufeff")
     for entry in work_sheet:
-        new_io = {"in": "", "out": "", "context_before": "", "context_after": ""}
         if len(entry) == 0:
             # Just ignore empty lines in the CSV file
             continue
@@ -373,20 +463,17 @@ def load_from_csv(language, delimiter=","):
                 'Entry {} in mapping {} has no "out" value.'.format(entry, language)
             )
 
-        new_io["in"] = entry[0].translate(remove_bom)
-        new_io["out"] = entry[1].translate(remove_bom)
-        try:
-            new_io["context_before"] = entry[2].translate(remove_bom)
-        except IndexError:
-            new_io["context_before"] = ""
-        try:
-            new_io["context_after"] = entry[3].translate(remove_bom)
-        except IndexError:
-            new_io["context_after"] = ""
-        for k in new_io:
-            if isinstance(new_io[k], (float, int)):
-                new_io[k] = str(new_io[k])
-        mapping.append(new_io)
+        rule_input, rule_output, context_before, context_after = (
+            cell.translate(remove_bom) for cell in (entry + ["", ""])[:4]
+        )
+        mapping.append(
+            {
+                "in": rule_input,
+                "out": rule_output,
+                "context_before": context_before,
+                "context_after": context_after,
+            }
+        )
 
     return mapping
 
@@ -12,92 +12,123 @@ import argparse
 import os
 import re
 import sys
+from typing import Callable, Dict, List
 from unittest import TestLoader, TestSuite, TextTestRunner
 
-# Unit tests
 from g2p.log import LOGGER
-from g2p.tests.test_check_ipa_arpabet import CheckIpaArpabetTest
-from g2p.tests.test_cli import CliTest
-from g2p.tests.test_create_mapping import MappingCreationTest
-from g2p.tests.test_doctor import DoctorTest
-from g2p.tests.test_doctor_expensive import ExpensiveDoctorTest
-from g2p.tests.test_fallback import FallbackTest
-from g2p.tests.test_indices import IndicesTest
-from g2p.tests.test_langs import LangTest
-from g2p.tests.test_lexicon_transducer import LexiconTransducerTest
-from g2p.tests.test_mappings import MappingTest
-from g2p.tests.test_network import NetworkLiteTest, NetworkTest
-from g2p.tests.test_tokenize_and_map import TokenizeAndMapTest
-from g2p.tests.test_tokenizer import TokenizerTest
-from g2p.tests.test_transducer import TransducerTest
-from g2p.tests.test_unidecode_transducer import UnidecodeTransducerTest
-from g2p.tests.test_utils import UtilsTest
-from g2p.tests.test_z_local_config import LocalConfigTest
-
-if sys.version_info >= (3, 8, 0):
-    from g2p.tests.test_api_resources import ResourceIntegrationTest
-    from g2p.tests.test_api_v2 import TestAPIV2
-
-    API_TEST_CLASSES = [ResourceIntegrationTest, TestAPIV2]
-else:
-    API_TEST_CLASSES = []
 
 LOADER = TestLoader()
 
-TRANSDUCER_TESTS = [
-    LOADER.loadTestsFromTestCase(test)
-    for test in [
-        IndicesTest,
-        TransducerTest,
-        UnidecodeTransducerTest,
-        LexiconTransducerTest,
+# The test modules are only imported when their suite is requested, since
+# importing them all (the API tests especially) is slow and most runs only
+# need some of them.
+
+
+def transducer_tests() -> List[TestSuite]:
+    from g2p.tests.test_indices import IndicesTest
+    from g2p.tests.test_lexicon_transducer import LexiconTransducerTest
+    from g2p.tests.test_transducer import TransducerTest
+    from g2p.tests.test_unidecode_transducer import UnidecodeTransducerTest
+
+    return [
+        LOADER.loadTestsFromTestCase(test)
+        for test in [
+            IndicesTest,
+            TransducerTest,
+            UnidecodeTransducerTest,
+            LexiconTransducerTest,
+        ]
     ]
-]
-
-MAPPINGS_TESTS = [
-    LOADER.loadTestsFromTestCase(test)
-    for test in [
-        FallbackTest,
-        MappingCreationTest,
-        MappingTest,
-        NetworkTest,
-        NetworkLiteTest,
-        UtilsTest,
-        TokenizerTest,
-        TokenizeAndMapTest,
-        CheckIpaArpabetTest,
+
+
+def mappings_tests() -> List[TestSuite]:
+    from g2p.tests.test_check_ipa_arpabet import CheckIpaArpabetTest
+    from g2p.tests.test_create_mapping import MappingCreationTest
+    from g2p.tests.test_fallback import FallbackTest
+    from g2p.tests.test_mappings import MappingTest
+    from g2p.tests.test_network import NetworkLiteTest, NetworkTest
+    from g2p.tests.test_tokenize_and_map import TokenizeAndMapTest
+    from g2p.tests.test_tokenizer import TokenizerTest
+    from g2p.tests.test_utils import UtilsTest
+
+    return [
+        LOADER.loadTestsFromTestCase(test)
+        for test in [
+            FallbackTest,
+            MappingCreationTest,
+            MappingTest,
+            NetworkTest,
+            NetworkLiteTest,
+            UtilsTest,
+            TokenizerTest,
+            TokenizeAndMapTest,
+            CheckIpaArpabetTest,
+        ]
     ]
-]
 
-LANGS_TESTS = [
-    LOADER.loadTestsFromTestCase(test)
-    for test in [
-        LangTest,
+
+def langs_tests() -> List[TestSuite]:
+    from g2p.tests.test_langs import LangTest
+
+    return [
+        LOADER.loadTestsFromTestCase(test)
+        for test in [
+            LangTest,
+        ]
     ]
-]
-
-INTEGRATION_TESTS = [
-    LOADER.loadTestsFromTestCase(test)
-    for test in [
-        CliTest,
-        DoctorTest,
-        ExpensiveDoctorTest,
+
+
+def integration_tests() -> List[TestSuite]:
+    from g2p.tests.test_cli import CliTest
+    from g2p.tests.test_doctor import DoctorTest
+    from g2p.tests.test_doctor_expensive import ExpensiveDoctorTest
+
+    if sys.version_info >= (3, 8, 0):
+        from g2p.tests.test_api_resources import ResourceIntegrationTest
+        from g2p.tests.test_api_v2 import TestAPIV2
+        from g2p.tests.test_app import StudioEventsTest, TransducerCacheTest
+
+        api_test_classes = [
+            ResourceIntegrationTest,
+            TestAPIV2,
+            TransducerCacheTest,
+            StudioEventsTest,
+        ]
+    else:
+        api_test_classes = []
+
+    return [
+        LOADER.loadTestsFromTestCase(test)
+        for test in [
+            CliTest,
+            DoctorTest,
+            ExpensiveDoctorTest,
+        ]
+        + api_test_classes
     ]
-    + API_TEST_CLASSES
-]
-
-# LocalConfigTest has to get run last, to avoid interactions with other test
-# cases, since it has side effects on the global database
-LAST_DEV_TEST = [
-    LOADER.loadTestsFromTestCase(test)
-    for test in [
-        LocalConfigTest,
+
+
+def last_dev_test() -> List[TestSuite]:
+    """LocalConfigTest has to get run last, to avoid interactions with other test
+    cases, since it has side effects on the global database"""
+    from g2p.tests.test_z_local_config import LocalConfigTest
+
+    return [
+        LOADER.loadTestsFromTestCase(test)
+        for test in [
+            LocalConfigTest,
+        ]
     ]
-]
 
-DEV_TESTS = (
-    TRANSDUCER_TESTS + MAPPINGS_TESTS + LANGS_TESTS + INTEGRATION_TESTS + LAST_DEV_TEST
-)
+
+def dev_tests() -> List[TestSuite]:
+    return (
+        transducer_tests()
+        + mappings_tests()
+        + langs_tests()
+        + integration_tests()
+        + last_dev_test()
+    )
 
 
 def list_tests(suite: TestSuite):
@@ -120,15 +151,25 @@ def describe_suite(suite: TestSuite):
     )
 
 
-SUITES = ("all", "dev", "integ", "langs", "mappings", "trans")
+SUITES: Dict[str, Callable[[], TestSuite]] = {
+    "all": lambda: LOADER.discover(os.path.dirname(__file__)),
+    "dev": lambda: TestSuite(dev_tests()),
+    "integ": lambda: TestSuite(integration_tests()),
+    "langs": lambda: TestSuite(langs_tests()),
+    "mappings": lambda: TestSuite(mappings_tests()),
+    "trans": lambda: TestSuite(transducer_tests()),
+}
 
 
-def run_tests(suite: str, describe: bool = False, verbosity: int = 3) -> bool:
+def run_tests(
+    suite: str, describe: bool = False, verbosity: int = 3, failfast: bool = False
+) -> bool:
     """Run the test suite specified in suite.
 
     Args:
         suite: one of SUITES, "dev" if the empty string
         describe: if True, list all the test cases instead of running them.
+        failfast: if True, stop the run at the first failure or error.
 
     Returns: Bool: True iff success
     """
@@ -136,39 +177,34 @@ def run_tests(suite: str, describe: bool = False, verbosity: int = 3) -> bool:
         LOGGER.info("No test suite specified, defaulting to dev.")
         suite = "dev"
 
-    if suite == "all":
-        test_suite = LOADER.discover(os.path.dirname(__file__))
-    elif suite == "trans":
-        test_suite = TestSuite(TRANSDUCER_TESTS)
-    elif suite == "langs":
-        test_suite = TestSuite(LANGS_TESTS)
-    elif suite == "mappings":
-        test_suite = TestSuite(MAPPINGS_TESTS)
-    elif suite == "integ":
-        test_suite = TestSuite(INTEGRATION_TESTS)
-    elif suite == "dev":
-        test_suite = TestSuite(DEV_TESTS)
-    else:
+    if suite not in SUITES:
         LOGGER.error("Please specify a test suite to run among: " + ", ".join(SUITES))
         return False
+    test_suite = SUITES[suite]()
 
     if describe:
         describe_suite(test_suite)
         return True
     else:
-        runner = TextTestRunner(verbosity=verbosity)
+        runner = TextTestRunner(verbosity=verbosity, failfast=failfast)
         success = runner.run(test_suite).wasSuccessful()
         if not success:
             LOGGER.error("Some tests failed. Please see log above.")
         return success
 
 
-def main():
+def main() -> int:
     parser = argparse.ArgumentParser(description="Run g2p test suites.")
     parser.add_argument("--quiet", "-q", action="store_true", help="reduce output")
     parser.add_argument(
         "--describe", action="store_true", help="describe the selected test suite"
     )
+    parser.add_argument(
+        "--failfast",
+        "-f",
+        action="store_true",
+        help="stop at the first failure or error",
+    )
     parser.add_argument(
         "suite",
         nargs="?",
@@ -177,10 +213,9 @@ def main():
         choices=SUITES,
     )
     args = parser.parse_args()
-    result = run_tests(args.suite, args.describe, 1 if args.quiet else 3)
-    if not result:
-        sys.exit(1)
+    result = run_tests(args.suite, args.describe, 1 if args.quiet else 3, args.failfast)
+    return 0 if result else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+"""Test the g2p studio Socket.IO event handlers and the transducer cache"""
+
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase, main
+from unittest.mock import AsyncMock, patch
+
+from g2p import app
+
+
+def mapping_payload(rule_output="b"):
+    """A mapping as sent by g2p studio in a conversion event"""
+    return {
+        "kwargs": {"in_lang": "spam", "out_lang": "eggs", "type": "mapping"},
+        "rules": [{"in": "a", "out": rule_output}],
+        "abbreviations": [],
+    }
+
+
+def conversion_message(input_string):
+    return {
+        "data": {
+            "index": False,
+            "input_string": input_string,
+            "mappings": [mapping_payload()],
+        }
+    }
+
+
+class TransducerCacheTest(TestCase):
+    def setUp(self):
+        app._TRANSDUCER_CACHE.clear()
+
+    def tearDown(self):
+        app._TRANSDUCER_CACHE.clear()
+
+    def test_same_mapping_is_reused(self):
+        transducer = app.mapping_to_transducer(mapping_payload())
+        self.assertIs(transducer, app.mapping_to_transducer(mapping_payload()))
+        self.assertEqual(transducer("a").output_string, "b")
+
+    def test_changed_mapping_is_rebuilt(self):
+        transducer = app.mapping_to_transducer(mapping_payload())
+        other = app.mapping_to_transducer(mapping_payload("c"))
+        self.assertIsNot(transducer, other)
+        self.assertEqual(other("a").output_string, "c")
+
+    def test_eviction(self):
+        transducers = [
+            app.mapping_to_transducer(mapping_payload(str(i)))
+            for i in range(app.TRANSDUCER_CACHE_SIZE)
+        ]
+        self.assertEqual(len(app._TRANSDUCER_CACHE), app.TRANSDUCER_CACHE_SIZE)
+        # using the first one again makes it the most recently used
+        self.assertIs(transducers[0], app.mapping_to_transducer(mapping_payload("0")))
+        app.mapping_to_transducer(mapping_payload("spam"))
+        self.assertEqual(len(app._TRANSDUCER_CACHE), app.TRANSDUCER_CACHE_SIZE)
+        self.assertIs(transducers[0], app.mapping_to_transducer(mapping_payload("0")))
+        # so the second one, now the least recently used, was evicted
+        self.assertIsNot(
+            transducers[1], app.mapping_to_transducer(mapping_payload("1"))
+        )
+
+
+class StudioEventsTest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        app._PENDING_CONVERSIONS.clear()
+
+    async def test_table_events(self):
+        with patch.object(app.SIO, "emit", new_callable=AsyncMock) as emit:
+            await app.change_table("sid", {"in_lang": "fra", "out_lang": "fra-ipa"})
+            await app.change_table("sid", {"in_lang": "custom", "out_lang": "spam"})
+        self.assertEqual(emit.call_count, 2)
+        tables, custom = (call.args[1] for call in emit.call_args_list)
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(tables[0]["kwargs"]["in_lang"], "fra")
+        self.assertEqual(custom, app.custom_table())
+
+    async def test_conversion_events_coalesce(self):
+        with patch.object(app.SIO, "emit", new_callable=AsyncMock) as emit, patch(
+            "g2p.app.CONVERSION_DELAY", 0.2
+        ):
+            # a burst of keystrokes, arriving one by one but faster than the delay
+            events = []
+            for i in range(1, 31):
+                events.append(
+                    asyncio.create_task(app.convert("sid", conversion_message("a" * i)))
+                )
+                await asyncio.sleep(0.001)
+            await asyncio.gather(*events)
+            self.assertEqual(emit.call_count, 1)
+            self.assertEqual(emit.call_args.args[1], {"output_string": "b" * 30})
+            # once typing has paused, the next event is converted on its own
+            await app.convert("sid", conversion_message("aa"))
+            self.assertEqual(emit.call_count, 2)
+            self.assertEqual(emit.call_args.args[1], {"output_string": "bb"})
+        self.assertEqual(app._PENDING_CONVERSIONS, {})
+
+    async def test_disconnect_drops_pending_conversion(self):
+        with patch.object(app.SIO, "emit", new_callable=AsyncMock) as emit:
+            event = asyncio.create_task(app.convert("sid", conversion_message("a")))
+            await asyncio.sleep(0)
+            await app.convert_disconnect("sid")
+            await event
+        emit.assert_not_called()
+
+
+if __name__ == "__main__":
+    main()
@@ -33,20 +33,21 @@ def rules_from_strings(*mapping: str) -> List[dict]:
 class MappingTest(TestCase):
     """Basic Mapping Test"""
 
-    def setUp(self):
-        self.test_mapping_no_norm = Mapping(
+    @classmethod
+    def setUpClass(cls):
+        cls.test_mapping_no_norm = Mapping(
             rules=[
                 {"in": "\u00e1", "out": "\u00e1"},
                 {"in": "\u0061\u0301", "out": "\u0061\u0301"},
             ],
             norm_form="none",
         )
-        self.test_mapping_norm = Mapping(rules=[{"in": "\u00e1", "out": "\u00e1"}])
+        cls.test_mapping_norm = Mapping(rules=[{"in": "\u00e1", "out": "\u00e1"}])
         with open(
             os.path.join(os.path.dirname(public_data), "git_to_ipa.json"),
             encoding="utf8",
         ) as f:
-            self.json_map = json.load(f)
+            cls.json_map = json.load(f)
 
     def test_normalization(self):
         self.assertEqual(
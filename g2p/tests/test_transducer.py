@@ -1,12 +1,24 @@
 #!/usr/bin/env python
 
+import gc
+import itertools
 import os
+import tracemalloc
 from unittest import TestCase, main
 
 from g2p.exceptions import MalformedMapping
 from g2p.mappings import Mapping
+from g2p.mappings.tokenizer import make_tokenizer
 from g2p.tests.public import PUBLIC_DIR
-from g2p.transducer import CompositeTransducer, Transducer, normalize_edges
+from g2p.transducer import (
+    WORD_CACHE_MAX_LENGTH,
+    WORD_CACHE_SIZE,
+    CompositeTransducer,
+    TokenizingTransducer,
+    Transducer,
+    _transduce_word,
+    normalize_edges,
+)
 
 
 class TransducerTest(TestCase):
@@ -166,6 +178,13 @@ class TransducerTest(TestCase):
         ctg += ctg
         self.assertEqual("abaaba", ctg.input_string)
         self.assertEqual("aaaaaa", ctg.output_string)
+        other_ctg = self.test_trans_composite("b")
+        ctg += other_ctg
+        self.assertEqual("abaabab", ctg.input_string)
+        self.assertEqual((6, "b"), ctg.input_nodes[-1])
+        self.assertEqual((6, "a"), ctg.tiers[1].output_nodes[-1])
+        self.assertEqual([[(0, 0)], [(0, 0)]], other_ctg.edges)
+        self.assertEqual([(0, "b")], other_ctg.input_nodes)
 
     def test_ordered(self):
         transducer_feed = self.test_trans_ordered_feed("a")
@@ -190,6 +209,60 @@ class TransducerTest(TestCase):
         self.assertEqual(self.test_trans_composite("aba").output_string, "aaa")
         self.assertEqual(self.test_trans_composite_2("aba").output_string, "bbb")
 
+    def test_tokenizing_word_cache(self):
+        _transduce_word.cache_clear()
+        transducer = TokenizingTransducer(self.test_trans_composite, make_tokenizer())
+        tg = transducer("aba aba")
+        self.assertEqual("aaa aaa", tg.output_string)
+        self.assertEqual(1, _transduce_word.cache_info().currsize)
+        # word graphs are cached, and changing one must not change the next
+        tg += tg
+        tg.tiers[0].debugger.append(["spam"])
+        tg = transducer("aba")
+        self.assertEqual("aaa", tg.output_string)
+        self.assertEqual([(0, 0), (1, 1), (2, 2)], tg.tiers[0].edges)
+        self.assertNotIn(["spam"], tg.tiers[0].debugger)
+        # long words are not cached
+        long_word = "ab" * WORD_CACHE_MAX_LENGTH
+        self.assertEqual("a" * len(long_word), transducer(long_word).output_string)
+        self.assertEqual(1, _transduce_word.cache_info().currsize)
+
+    def test_long_input_not_retained(self):
+        # a graph's debugger grows quickly with the length of its input, so
+        # none of it may be kept around after the graph is gone
+        long_input = "aba " * 300
+        self.test_trans_composite(long_input)
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            self.test_trans_composite(long_input[::-1])
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertLess(retained, 100_000)
+        # the word cache is shared by all tokenizing transducers, so however
+        # many of them see however many distinct words, it stays bounded
+        words = ["".join(word) for word in itertools.product("ab", repeat=10)]
+        transducers = [
+            TokenizingTransducer(self.test_trans_composite, make_tokenizer()),
+            TokenizingTransducer(self.test_trans_composite_2, make_tokenizer()),
+        ]
+        _transduce_word.cache_clear()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            for transducer in transducers:
+                transducer(" ".join(words[: 2 * WORD_CACHE_SIZE]))
+            gc.collect()
+            retained = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(WORD_CACHE_SIZE, _transduce_word.cache_info().currsize)
+        # about 2.4MB for the cached graphs, a quarter of what one cache per
+        # transducer, each holding every word it saw, would keep
+        self.assertLess(retained, 4_000_000)
+
     def test_rule_ordering(self):
         self.assertEqual(self.test_trans_as_written("'y").output_string, "jˀ")
         self.assertEqual(self.test_trans_longest_first("'y").output_string, "ʣˀ")
@@ -199,6 +272,48 @@ class TransducerTest(TestCase):
         self.assertEqual(self.test_case_sensitive_transducer("'n").output_string, "n̓")
         self.assertEqual(self.test_case_insensitive_transducer("'N").output_string, "n̓")
         self.assertEqual(self.test_case_insensitive_transducer("'n").output_string, "n̓")
+        upper_rule_transducer = Transducer(
+            Mapping(rules=[{"in": "'N", "out": "n̓"}], case_sensitive=False)
+        )
+        self.assertEqual(upper_rule_transducer("'n").output_string, "n̓")
+
+    def test_literal_rules(self):
+        escaped_transducer = Transducer(
+            Mapping(
+                rules=[{"in": "a.b", "out": "c"}, {"in": "x", "out": "y"}],
+                escape_special=True,
+            )
+        )
+        self.assertEqual(escaped_transducer("a.b").output_string, "c")
+        self.assertEqual(escaped_transducer("axb").output_string, "ayb")
+        unescaped_transducer = Transducer(Mapping(rules=[{"in": "a.b", "out": "c"}]))
+        self.assertEqual(unescaped_transducer("axb").output_string, "c")
+        case_insensitive_transducer = Transducer(
+            Mapping(
+                rules=[{"in": "A", "out": "ı"}, {"in": "i", "out": "b"}],
+                case_sensitive=False,
+            )
+        )
+        self.assertEqual(case_insensitive_transducer("a").output_string, "b")
+        # case folding can change the length of a literal (ß -> ss, ﬁ -> fi),
+        # which must not make its rule look like it preserves length
+        rules = [{"in": "ß", "out": "ss"}, {"in": "s{1}a{2}", "out": "a{2}s{1}"}]
+        expected_edges = [(0, 0), (0, 2), (1, 1), (2, 3), (2, 5), (3, 4)]
+        for case_sensitive in (True, False):
+            transducer = Transducer(Mapping(rules=rules, case_sensitive=case_sensitive))
+            self.assertEqual(transducer("ßaßa").edges, expected_edges)
+        folding_transducer = Transducer(
+            Mapping(
+                rules=[
+                    {"in": "ß{1}s{2}", "out": "ß{1}"},
+                    {"in": "ﬁ{1}ﬁ{2}", "out": "ﬁﬁ{2}ﬁ{1}"},
+                    {"in": "ﬁ", "out": "bs"},
+                    {"in": "ß{1}a{2}", "out": "ß{1}"},
+                ],
+                case_sensitive=False,
+            )
+        )
+        self.assertEqual(folding_transducer("ﬁﬁbbßaﬁ").output_string, "bsbsbbbßabs")
 
     def test_regex_set(self):
         # https://github.com/roedoejet/g2p/issues/15
@@ -80,6 +80,12 @@ class UtilsTest(TestCase):
         while len(empty_rows) < 10:
             empty_rows.append(["", "", "", "", "", ""])
         self.assertEqual(utils.flatten_abbreviations_format(test_rows), default_dict)
+        self.assertEqual(
+            utils.flatten_abbreviations_format(
+                [["VOWEL", "a", "", "e"], [], ["", "x"], ["VOWEL", "i", "o", "u"]]
+            ),
+            {"VOWEL": ["a", "e", "i", "o", "u"]},
+        )
         self.assertEqual(utils.expand_abbreviations_format(default_dict), test_rows)
         self.assertEqual(utils.expand_abbreviations_format({}), empty_rows)
 
@@ -90,6 +96,8 @@ class UtilsTest(TestCase):
         self.assertEqual("\u0000", utils.unicode_escape("\\u0000"))
         self.assertEqual("\u0331", utils.unicode_escape("\\u0331"))
         self.assertEqual("\u26F0", utils.unicode_escape("\\u26F0"))
+        self.assertEqual("plain", utils.unicode_escape("plain"))
+        self.assertEqual("\\b\\d\u0331", utils.unicode_escape("\\b\\d\\u0331"))
 
     def test_fixed_width(self):
         test_dict = defaultdict(list)
@@ -100,6 +108,8 @@ class UtilsTest(TestCase):
             (utils.create_fixed_width_lookbehind("a|b|cc"), 2),
             (utils.create_fixed_width_lookbehind("a|'|b|cc|ddd|$"), 4),
             (utils.create_fixed_width_lookbehind("a|^|$"), 2),
+            (utils.create_fixed_width_lookbehind("a|b|a"), 1),
+            (utils.create_fixed_width_lookbehind("a|^|b"), 2),
             (utils.create_fixed_width_lookbehind("[abcd]"), 1),
             (utils.create_fixed_width_lookbehind(r"[x'kgh\.𝚐̲𝚔̲𝚡̲̲]"), 1),
             (
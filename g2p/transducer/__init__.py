@@ -6,8 +6,10 @@ which are responsible for performing transductions in the g2p library.
 import copy
 import re
 import unicodedata
-from collections import OrderedDict, defaultdict
-from typing import DefaultDict, Dict, List, Optional, Set, Tuple, Union
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from typing import DefaultDict, Dict, List, Optional, Tuple, Union
 
 import text_unidecode  # type: ignore
 
@@ -16,9 +18,11 @@ from g2p.mappings import MAPPING_TYPE, Mapping
 from g2p.mappings.langs.utils import is_arpabet, is_panphon
 from g2p.mappings.utils import (
     Rule,
+    case_fold,
     compose_indices,
     find_alignment,
     is_ipa,
+    literal_rule_input,
     normalize,
     normalize_with_indices,
     strip_index_notation,
@@ -46,6 +50,23 @@ ChangeLog = List[List[int]]
 
 UNIDECODE_SPECIALS = ["@", "?", "'", ",", ":"]
 
+# Explicit index notation, e.g. the "1" and the "a" in "a{1}"
+INDEX_MATCH_PATTERN = re.compile(r"(?<={)\d+(?=})")
+CHAR_MATCH_PATTERN = re.compile(r"[^0-9\{\}]+(?={\d+})", re.U)
+
+
+@lru_cache(maxsize=1024)
+def explicit_index_matches(string: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return the characters and the explicit indices found in a rule string,
+    scanning each rule string only once however often its rule matches.
+
+    For example, "a{1}bc{2}" gives (("a", "bc"), ("1", "2"))
+    """
+    return (
+        tuple(x.group() for x in CHAR_MATCH_PATTERN.finditer(string)),
+        tuple(x.group() for x in INDEX_MATCH_PATTERN.finditer(string)),
+    )
+
 
 def normalize_edges(
     edges: List[Tuple[int, Optional[int]]]
@@ -60,27 +81,38 @@ def normalize_edges(
       that None only occurs if the output is empty)
     - Sorts edges based on the input and suppresses duplicates
     """
-    to_remove: Set[int] = set()
-    for i, edge in enumerate(edges):
+    # edges are compared by value, so a duplicate of a deletion is not removed
+    deletions: DefaultDict[int, list] = defaultdict(list)
+    for edge in edges:
         if edge[1] is None:
-            for j, other_edge in enumerate(edges):
-                if other_edge != edge and other_edge[0] == edge[0]:
-                    to_remove.add(j)
-    edges = [edge for i, edge in enumerate(edges) if i not in to_remove]
+            deletions[edge[0]].append(edge)
+    edges = [
+        edge
+        for edge in edges
+        if edge[0] not in deletions
+        or all(deletion == edge for deletion in deletions[edge[0]])
+    ]
     # sort based on inputs
-    edges.sort(key=lambda x: x[0])
-    for i, edge in enumerate(edges):
-        if edge[1] is None:
-            # if previous exists, use that, otherwise use following, otherwise None
-            previous = [x for x in edges[:i] if x[1] is not None]
-            # Note: if len(edges) == 1, edges[1:] is empty, not an IndexError
-            following = [x for x in edges[i + 1 :] if x[1] is not None]
-            if previous:
-                edges[i] = (edge[0], previous[-1][1])
-            elif following:
-                edges[i] = (edge[0], following[0][1])
+    edges.sort(key=itemgetter(0))
+    # find the following non-deletion output of each edge in a backwards pass
+    following_outputs: List[Optional[int]] = [None] * len(edges)
+    following: Optional[int] = None
+    for i in range(len(edges) - 1, -1, -1):
+        following_outputs[i] = following
+        if edges[i][1] is not None:
+            following = edges[i][1]
+    # then resolve deletions in a forwards pass: use the previous output if it
+    # exists, otherwise the following one, otherwise None
+    resolved = []
+    previous: Optional[int] = None
+    for (i, j), following in zip(edges, following_outputs):
+        if j is None:
+            j = following if previous is None else previous
+        if j is not None:
+            previous = j
+        resolved.append((i, j))
     # uniquify preserving order
-    return list(OrderedDict.fromkeys((i, j) for i, j in edges))
+    return list(dict.fromkeys(resolved))
 
 
 class TransductionGraph(BaseTransductionGraph):
@@ -93,9 +125,10 @@ class TransductionGraph(BaseTransductionGraph):
         # Plain strings
         self._input_string = input_string
         self._output_string = input_string
-        # Nodes
-        self._input_nodes: List[Tuple[int, str]] = list(enumerate(input_string))
-        self._output_nodes: List[Tuple[int, str]] = list(enumerate(input_string))
+        # Nodes, only built from the strings when they are asked for, since the
+        # output string changes with every rule application
+        self._input_nodes: Optional[List[Tuple[int, str]]] = None
+        self._output_nodes: Optional[List[Tuple[int, str]]] = None
         # Edges
         self._edges: List[Tuple[int, Optional[int]]] = [
             (i, i) for i in range(len(input_string))
@@ -115,7 +148,7 @@ class TransductionGraph(BaseTransductionGraph):
     def input_string(self, value):
         # Only modify this if you're also adjusting the edges at the same time!
         self._input_string = value
-        self._input_nodes = list(enumerate(value))
+        self._input_nodes = None
 
     @property
     def output_string(self) -> str:
@@ -125,11 +158,13 @@ class TransductionGraph(BaseTransductionGraph):
     @output_string.setter
     def output_string(self, value):
         self._output_string = value
-        self._output_nodes = list(enumerate(value))
+        self._output_nodes = None
 
     @property
     def input_nodes(self) -> List[Tuple[int, str]]:
         """List of nodes (index and character string) corresponding to the input"""
+        if self._input_nodes is None:
+            self._input_nodes = list(enumerate(self._input_string))
         return self._input_nodes
 
     @input_nodes.setter
@@ -141,6 +176,8 @@ class TransductionGraph(BaseTransductionGraph):
     @property
     def output_nodes(self) -> List[Tuple[int, str]]:
         """List of nodes (index and character string) corresponding to the output"""
+        if self._output_nodes is None:
+            self._output_nodes = list(enumerate(self._output_string))
         return self._output_nodes
 
     @output_nodes.setter
@@ -201,12 +238,12 @@ class TransductionGraph(BaseTransductionGraph):
         for edge in edges:
             assert edge[0] is not None  # Empty inputs are not allowed
             if edge[1] is None:
-                out_edges.append((self._input_nodes[edge[0]][1], None))
+                out_edges.append((self.input_nodes[edge[0]][1], None))
             else:
                 out_edges.append(
                     (
-                        self._input_nodes[edge[0]][1],
-                        self._output_nodes[edge[1]][1],
+                        self.input_nodes[edge[0]][1],
+                        self.output_nodes[edge[1]][1],
                     )
                 )
         return out_edges
@@ -376,35 +413,52 @@ class TransductionGraph(BaseTransductionGraph):
             "edges": self._edges,
             "input": self._input_string,
             "output": self._output_string,
-            "input_nodes": self._input_nodes,
-            "output_nodes": self._output_nodes,
+            "input_nodes": self.input_nodes,
+            "output_nodes": self.output_nodes,
         }
 
     def clear_debugger(self):
         self._debugger = []
 
+    def copy(self):
+        """Return a copy of self which can be modified without affecting self."""
+        tg = TransductionGraph(self._input_string)
+        tg._output_string = self._output_string
+        tg._edges = list(self._edges)
+        tg._debugger = [list(step) for step in self._debugger]
+        return tg
+
     def append(self, tg):
         """Append the nodes, edges, strings and debugger from tg to self,
         shifting indices so tg nodes and edges are added after those of self.
         """
-        in_offset = len(self._input_nodes)
-        out_offset = len(self._output_nodes)
-        # append input and output strings
-        self._input_string += tg._input_string
-        self._output_string += tg._output_string
-        # append nodes
-        self._input_nodes += [(i + in_offset, x) for (i, x) in tg._input_nodes]
-        self._output_nodes += [(i + out_offset, x) for (i, x) in tg._output_nodes]
-        # append edges and normalize
-        self._edges = normalize_edges(
-            self._edges
-            + [
+        self.extend([tg])
+
+    def extend(self, tgs):
+        """Append each of tgs to self in turn, like append, but join the strings
+        and normalize the edges only once for all of them.
+        """
+        input_strings = [self._input_string]
+        output_strings = [self._output_string]
+        in_offset = len(self._input_string)
+        out_offset = len(self._output_string)
+        edges = list(self._edges)
+        debugger = list(self._debugger)
+        for tg in tgs:
+            edges += [
                 (i + in_offset, None if j is None else j + out_offset)
                 for i, j in tg.edges
             ]
-        )
-        # append debuggers
-        self._debugger += tg._debugger
+            debugger += tg._debugger
+            input_strings.append(tg._input_string)
+            output_strings.append(tg._output_string)
+            in_offset += len(tg._input_string)
+            out_offset += len(tg._output_string)
+        # the nodes follow from the strings
+        self.input_string = "".join(input_strings)
+        self.output_string = "".join(output_strings)
+        self._edges = normalize_edges(edges)
+        self._debugger[:] = debugger
 
     def __iadd__(self, tg):
         self.append(tg)
@@ -427,8 +481,7 @@ class Transducer(BaseTransducer):
         self.preserve_case = mapping.preserve_case
         self.norm_form = mapping.norm_form
         self.out_delimiter = mapping.out_delimiter
-        self._index_match_pattern = re.compile(r"(?<={)\d+(?=})")
-        self._char_match_pattern = re.compile(r"[^0-9\{\}]+(?={\d+})", re.U)
+        self._rule_literals = [self._rule_literal(io) for io in mapping.rules]
 
     def __repr__(self):
         return f"{self.__class__} between {self.mapping.in_lang} and {self.mapping.out_lang}"
@@ -467,6 +520,18 @@ class Transducer(BaseTransducer):
         else:
             return -1
 
+    def _rule_literal(self, rule: Rule) -> Optional[str]:
+        """Return the literal string a rule's input must find in order to match,
+        or None if the rule can only be found with its regex.
+
+        For case-insensitive mappings the literal is case folded, and must be
+        looked for in the case folded output (see `case_fold`).
+        """
+        literal = literal_rule_input(rule.rule_input)
+        if literal is None or self.case_sensitive:
+            return literal
+        return case_fold(literal)
+
     @property
     def in_lang(self) -> str:
         """Input language node name"""
@@ -488,32 +553,29 @@ class Transducer(BaseTransducer):
         """
 
         indices_seen: Dict[int, int] = defaultdict(int)
-        for i, char in enumerate(output_string):
+        # every intermediate character resolves to exactly one character, so the
+        # result is built in a single pass instead of splicing it in each time
+        resolved_chars = []
+        for char in output_string:
             intermediate_index = self._pua_to_index(char)
             # if not Private Supplementary Use character
             if intermediate_index < 0:
+                resolved_chars.append(char)
                 continue
             output_char_index = indices_seen[intermediate_index]
             try:
-                output_string = (
-                    output_string[:i]
-                    + strip_index_notation(
-                        self.mapping.rules[intermediate_index].rule_output
-                    )[output_char_index]
-                    + output_string[i + 1 :]
-                )
+                resolved_char = strip_index_notation(
+                    self.mapping.rules[intermediate_index].rule_output
+                )[output_char_index]
             except IndexError:
                 indices_seen[intermediate_index] = 0
                 output_char_index = 0
-                output_string = (
-                    output_string[:i]
-                    + strip_index_notation(
-                        self.mapping.rules[intermediate_index].rule_output
-                    )[output_char_index]
-                    + output_string[i + 1 :]
-                )
+                resolved_char = strip_index_notation(
+                    self.mapping.rules[intermediate_index].rule_output
+                )[output_char_index]
+            resolved_chars.append(resolved_char)
             indices_seen[intermediate_index] += 1
-        return output_string
+        return "".join(resolved_chars)
 
     def get_match_groups(
         self,
@@ -549,12 +611,7 @@ class Transducer(BaseTransducer):
             inputs (dict): dictionary containing matches grouped by explicit index match
             outputs (dict): dictionary containing matches grouped by explicit index match
         """
-        input_char_matches = [
-            x.group() for x in self._char_match_pattern.finditer(io.rule_input)
-        ]
-        input_match_indices = [
-            x.group() for x in self._index_match_pattern.finditer(io.rule_input)
-        ]
+        input_char_matches, input_match_indices = explicit_index_matches(io.rule_input)
         inputs: Dict[str, List[dict]] = {}
         index = 0
 
@@ -569,12 +626,7 @@ class Transducer(BaseTransducer):
                 else:
                     inputs[m] = [{"index": index + input_start, "string": char}]
                 index += 1
-        output_char_matches = [
-            x.group() for x in self._char_match_pattern.finditer(out_string)
-        ]
-        output_match_indices = [
-            x.group() for x in self._index_match_pattern.finditer(out_string)
-        ]
+        output_char_matches, output_match_indices = explicit_index_matches(out_string)
         outputs: Dict[str, List[dict]] = {}
         index = 0
         for i, m in enumerate(output_match_indices):
@@ -598,16 +650,18 @@ class Transducer(BaseTransducer):
         tg.output_string = (
             tg.output_string[:index_to_delete] + tg.output_string[index_to_delete + 1 :]
         )
-        # update indices
-        for k, edge in enumerate(tg.edges):
-            if (
-                edge[1] is not None
-                and (ahh == 0 or tg.edges[k - 1][1] is None)
-                and edge[1] == index_to_delete
+        # update indices (in place, since each edge looks at the updated previous one)
+        edges = tg.edges
+        for k, edge in enumerate(edges):
+            output_index = edge[1]
+            if output_index is None or output_index < index_to_delete:
+                continue
+            if output_index == index_to_delete and (
+                ahh == 0 or edges[k - 1][1] is None
             ):
-                tg.edges[k] = (edge[0], None)
-            elif edge[1] is not None and edge[1] >= index_to_delete:
-                tg.edges[k] = (edge[0], edge[1] - 1)
+                edges[k] = (edge[0], None)
+            else:
+                edges[k] = (edge[0], output_index - 1)
 
     def insert_character(self, tg, character_to_insert, index_to_insert_character):
         """Insert character at `index_to_insert_character` in TransductionGraph output
@@ -623,9 +677,14 @@ class Transducer(BaseTransducer):
             + character_to_insert
             + tg.output_string[index_to_insert_character:]
         )
-        for j, edge in enumerate(tg.edges):
-            if edge[1] is not None and edge[1] >= index_to_insert_character:
-                tg.edges[j] = (edge[0], edge[1] + 1)
+        tg.edges[:] = [
+            (
+                (edge[0], edge[1] + 1)
+                if edge[1] is not None and edge[1] >= index_to_insert_character
+                else edge
+            )
+            for edge in tg.edges
+        ]
 
     def change_character(self, tg, character, index_to_change):
         """Change character at `index_to_change` in TransductionGraph output to `character`
@@ -642,6 +701,24 @@ class Transducer(BaseTransducer):
             + tg.output_string[index_to_change + 1 :]
         )
 
+    def change_characters(self, tg, changes: Dict[int, str]):
+        """Change several characters in TransductionGraph output at once
+
+        Args:
+            tg (TransductionGraph): the current Transduction Graph
+            changes (Dict[int, str]): the characters to change to, keyed by index
+        """
+        output_length = len(tg.output_string)
+        if len(changes) < 2 or not all(0 <= i < output_length for i in changes):
+            for index_to_change, character in changes.items():
+                self.change_character(tg, character, index_to_change)
+            return
+        output = list(tg.output_string)
+        for index_to_change, character in changes.items():
+            assert len(character) == 1
+            output[index_to_change] = character
+        tg.output_string = "".join(output)
+
     def update_explicit_indices(
         self, tg, match, start_end, io, diff_from_input, diff_from_output, out_string
     ):
@@ -742,18 +819,25 @@ class Transducer(BaseTransducer):
             in_string, out_string
         )
 
+        # while the shorter string still has that output:
+        #   keep that index, and convert the character
+        # these changes all come before any insertion or deletion, so the
+        # output string only has to be rebuilt once for all of them
+        self.change_characters(
+            tg,
+            {
+                i + match_start + diff_from_output[i + match_start]: out_string[i]
+                for i in range(len(shortest))
+            },
+        )
         deleted = 0
-        for i, char in enumerate(longest):
+        for i, char in enumerate(longest[len(shortest) :], start=len(shortest)):
             output_index = i + match_start + diff_from_output[i + match_start]
-            # if the shorter string still has that output:
-            #   keep that index, and convert the character
-            if i <= len(shortest) - 1:
-                self.change_character(tg, out_string[i], output_index)
             # if the output string is longer than the input string
             # then it is an insertion and we should:
             #  - increment every edge after the insertion
             #  - connect every input edge connected to the previous output to that new insertion
-            elif process == "insert":
+            if process == "insert":
                 self.insert_character(tg, char, output_index)
                 # add insertion edge
                 for edge in tg.edges:
@@ -886,20 +970,58 @@ class Transducer(BaseTransducer):
         # iterate rules
         # these variables tracks changes in the output string across processing
         # matches of the same pattern
-        diff_from_input = defaultdict(int, {n: 0 for n in range(len(tg.output_string))})
-        for io in self.mapping.rules:
+        diff_from_input = defaultdict(
+            int, dict.fromkeys(range(len(tg.output_string)), 0)
+        )
+        # the case folded output used to look for literal rule inputs, and the
+        # output it was folded from
+        folded_source: Optional[str] = None
+        folded_output = ""
+        for io, literal in zip(self.mapping.rules, self._rule_literals):
             assert isinstance(io, Rule)
             # Do not allow empty rules
             if not io.rule_input and not io.rule_output:
                 continue
-            io = copy.deepcopy(io)
-            # create empty out_string
-            out_string = ""
+            # A substring test is much cheaper than a regex scan that finds nothing
+            if literal is not None:
+                if self.case_sensitive:
+                    haystack = tg.output_string
+                elif folded_source is tg.output_string:
+                    haystack = folded_output
+                else:
+                    folded_source = tg.output_string
+                    haystack = folded_output = case_fold(folded_source)
+                if literal not in haystack:
+                    continue
+            matches = list(io.match_pattern.finditer(tg.output_string))  # type: ignore
+            # rules that don't match need none of the bookkeeping below
+            if not matches:
+                continue
+            # the rule is only read here, so the output (with its delimiter) and
+            # its index-free form are computed once per rule, not once per match
+            if io.intermediate_form:
+                out_string = io.intermediate_form
+            else:
+                out_string = io.rule_output
+            if self.out_delimiter:
+                out_string += self.out_delimiter
+            out_string_no_index = strip_index_notation(out_string)
+            explicit_indices = bool(
+                explicit_index_matches(io.rule_input)[0]
+                and explicit_index_matches(out_string)[0]
+            )
+            # a literal rule whose output is as long as its input (most 1:1
+            # rules) never shifts the output, so there are no offsets to update.
+            # All its matches are as long as its unfolded input, but the literal
+            # may be case folded to a different length (ß -> ss), so measure a
+            # match instead.
+            length_preserving = literal is not None and (
+                len(matches[0].group()) == len(out_string_no_index)
+            )
             diff_from_output = defaultdict(
-                int, {n: 0 for n in range(len(tg.output_string))}
+                int, dict.fromkeys(range(len(tg.output_string)), 0)
             )
-            matches = reversed(list(io.match_pattern.finditer(tg.output_string)))  # type: ignore
-            for match_i, match in enumerate(matches):
+            for match_i, match in enumerate(reversed(matches)):
                 debug_string = tg.output_string
                 start = match.start()
                 end = match.end()
@@ -907,15 +1029,8 @@ class Transducer(BaseTransducer):
                     start += diff_from_output[start]
                     end += diff_from_output[end - 1]
                 if io.intermediate_form:
-                    out_string = io.intermediate_form
                     intermediate_forms = True
-                else:
-                    out_string = io.rule_output
-                if self.out_delimiter:
-                    out_string += self.out_delimiter
-                if any(self._char_match_pattern.finditer(io.rule_input)) and any(
-                    self._char_match_pattern.finditer(out_string)
-                ):
+                if explicit_indices:
                     self.update_explicit_indices(
                         tg,
                         match,
@@ -947,9 +1062,10 @@ class Transducer(BaseTransducer):
                             "end": match.end(),
                         }
                     )
-                out_string = strip_index_notation(out_string)
+                if length_preserving:
+                    continue
                 # update the output intermediate diff after each match
-                diff = len(out_string) - len(match.group())
+                diff = len(out_string_no_index) - len(match.group())
 
                 try:
                     input_index = self.get_input_from_output(tg, match.end() - 1)
@@ -1017,8 +1133,8 @@ class CompositeTransductionGraph(TransductionGraph):
         self._input_string = tg_list[0].input_string
         self._output_string = tg_list[-1].output_string
         # Nodes
-        self._input_nodes = tg_list[0].input_nodes
-        self._output_nodes = tg_list[-1].output_nodes
+        self._input_nodes = None
+        self._output_nodes = None
         # Edges
         self._edges = [x.edges for x in tg_list]
         # Debugger
@@ -1099,18 +1215,25 @@ class CompositeTransductionGraph(TransductionGraph):
             "edges": self._edges,
             "input": self._input_string,
             "output": self._output_string,
-            "input_nodes": self._input_nodes,
-            "output_nodes": self._output_nodes,
+            "input_nodes": self.input_nodes,
+            "output_nodes": self.output_nodes,
         }
 
     def append(self, tg):
-        if isinstance(tg, CompositeTransductionGraph):
-            assert len(self._tiers) == len(tg._tiers)
-            for i in range(len(self._tiers)):
-                self._tiers[i].append(copy.deepcopy(tg.tiers[i]))
-        else:
-            for tier in self._tiers:
-                tier.append(copy.deepcopy(tg))
+        self.extend([tg])
+
+    def extend(self, tgs):
+        # TransductionGraph.extend only reads from the graphs and builds new
+        # nodes and edges, so there is no need to copy them first
+        for i, tier in enumerate(self._tiers):
+            tier_tgs = []
+            for tg in tgs:
+                if isinstance(tg, CompositeTransductionGraph):
+                    assert len(self._tiers) == len(tg._tiers)
+                    tier_tgs.append(tg.tiers[i])
+                else:
+                    tier_tgs.append(tg)
+            tier.extend(tier_tgs)
         self.__init__(self.tiers)
 
     def __iadd__(self, tg):
@@ -1122,6 +1245,9 @@ class CompositeTransductionGraph(TransductionGraph):
         for tier in self._tiers:
             tier.clear_debugger()
 
+    def copy(self):
+        return CompositeTransductionGraph([tier.copy() for tier in self._tiers])
+
 
 class CompositeTransducer(BaseTransducer):
     """This class combines Transducer objects to form a CompositeTransducer object.
@@ -1189,6 +1315,23 @@ class CompositeTransducer(BaseTransducer):
             return result
 
 
+# The same words come back again and again in running text, so the graphs of
+# short ones are cached. A single cache is shared by all TokenizingTransducers,
+# so that its size stays bounded however many of them make_g2p keeps around, and
+# it only takes short words, since a graph's debugger grows quickly with the
+# length of its input.
+WORD_CACHE_SIZE = 256
+WORD_CACHE_MAX_LENGTH = 32
+
+
+@lru_cache(maxsize=WORD_CACHE_SIZE)
+def _transduce_word(
+    transducer: Union[Transducer, CompositeTransducer], word: str
+) -> TransductionGraph:
+    """Transduce word with transducer, for the word cache"""
+    return transducer(word)
+
+
 class TokenizingTransducer(BaseTransducer):
     """This class combines tokenization and transduction.
 
@@ -1208,6 +1351,16 @@ class TokenizingTransducer(BaseTransducer):
         self._transducer = transducer
         self._tokenizer = tokenizer
 
+    def _word_graph(self, word: str) -> TransductionGraph:
+        """Transduce a single word, from the cache if it is short enough.
+
+        Cached graphs are copied before being returned, since callers are free
+        to modify them.
+        """
+        if len(word) > WORD_CACHE_MAX_LENGTH:
+            return self._transducer(word)
+        return _transduce_word(self._transducer, word).copy()
+
     def __call__(self, to_convert: str):
         # perform normalization before tokenizing, since it can change tokenization
         if self._transducer.norm_form:
@@ -1218,13 +1371,15 @@ class TokenizingTransducer(BaseTransducer):
         tg = self._transducer("")
         tg.clear_debugger()  # clear the meaningless initial debugger
 
+        token_tgs = []
         for token in self._tokenizer.tokenize_text(to_convert):
             if token.is_word:
-                word_tg = self._transducer(token.text)
-                tg += word_tg
+                token_tgs.append(self._word_graph(token.text))
             else:
-                non_word_tg = TransductionGraph(token.text)
-                tg += non_word_tg
+                token_tgs.append(TransductionGraph(token.text))
+        # joining all the tokens at once saves renormalizing the edges for each one
+        if token_tgs:
+            tg.extend(token_tgs)
         return tg
 
     @property
@@ -3,7 +3,6 @@
 import sys
 
 if sys.version_info < (3, 8, 0):  # pragma: no cover
-    raise Exception("")
     sys.exit(
         "ERROR: While the g2p CLI and library can still run on Python 3.7, "
         "g2p-studio requires Python 3.8 or more recent.\n"
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import sys
+
 from g2p.tests.run import main
 
-main()
+sys.exit(main())